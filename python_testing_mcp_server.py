@@ -1,3 +1,5 @@
+import asyncio
+import collections
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'tools'))
@@ -10,41 +12,52 @@ from mutation_tester import run_mutation_testing
 
 mcp = FastMCP(name="python_testing_tools")
 
+# Mutation testing rewrites the target file in place, so no other tool may
+# read a file while it is being mutation tested. Every tool holds the lock for
+# its target's real path (symlinks resolved, like the mutation engine's
+# target); runs on different files proceed concurrently.
+_file_locks = collections.defaultdict(asyncio.Lock)
+
+async def _run_locked(func, file_path: str, *args) -> str:
+    """Run func(file_path, *args) in a worker thread while holding file_path's lock."""
+    async with _file_locks[os.path.realpath(file_path)]:
+        return await asyncio.to_thread(func, file_path, *args)
+
 @mcp.tool()
-def generate_unit_tests_tool(file_path: str) -> str:
+async def generate_unit_tests_tool(file_path: str) -> str:
     """
     Takes a Python file path as input, generates a basic unit test file for it,
     and saves it, returning the new file's path.
     It uses Gemini to generate the test cases.
     """
-    return generate_unit_tests(file_path)
+    return await _run_locked(generate_unit_tests, file_path)
 
 @mcp.tool()
-def fuzz_test_function_tool(file_path: str, function_name: str) -> str:
+async def fuzz_test_function_tool(file_path: str, function_name: str) -> str:
     """
     Performs fuzz testing on a specific function within a given file.
     It uses Gemini to generate intelligent fuzzing inputs.
     """
-    return fuzz_test_function(file_path, function_name)
+    return await _run_locked(fuzz_test_function, file_path, function_name)
 
 @mcp.tool()
-def generate_coverage_tests_tool(file_path: str) -> str:
+async def generate_coverage_tests_tool(file_path: str) -> str:
     """
     Generates comprehensive test cases designed to achieve maximum code coverage.
     Analyzes code structure using AST and creates tests for all branches, loops, exception paths, and edge cases.
     Uses AI to generate intelligent test cases that target specific coverage scenarios.
     """
-    return generate_coverage_tests(file_path)
+    return await _run_locked(generate_coverage_tests, file_path)
 
 @mcp.tool()
-def mutation_testing_tool(file_path: str) -> str:
+async def mutation_testing_tool(file_path: str) -> str:
     """
     Performs intelligent mutation testing using mutmut and AI analysis.
     Runs mutations on the code, analyzes which mutations survived testing,
     and provides AI-powered recommendations for improving test coverage.
     Returns detailed report with mutation score and specific test suggestions.
     """
-    return run_mutation_testing(file_path)
+    return await _run_locked(run_mutation_testing, file_path)
 
 if __name__ == "__main__":
     mcp.run()
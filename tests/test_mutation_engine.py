@@ -0,0 +1,51 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.mutation_engine import MutationEngine, _split_test_command, format_test_command
+
+CALC_SOURCE = '''def add(a, b):
+    return a + b
+
+if __name__ == "__main__":
+    assert add(2, 3) == 5
+'''
+
+
+def _write_target(tmp_path):
+    """Write calc.py into a directory whose name contains a space and a quote."""
+    target_dir = tmp_path / "it's dir"
+    target_dir.mkdir()
+    target = target_dir / "calc.py"
+    target.write_text(CALC_SOURCE)
+    return target
+
+
+def test_format_test_command_round_trips_paths_with_space_and_quote(tmp_path):
+    test_file = str(tmp_path / "it's dir" / "test_calc.py")
+    args = ["python", "-m", "pytest", test_file, "-v"]
+
+    assert _split_test_command(format_test_command(args)) == tuple(args)
+
+
+def test_detected_pytest_command_keeps_path_whole(tmp_path):
+    target = _write_target(tmp_path)
+    test_file = target.parent / "test_calc.py"
+    test_file.write_text("from calc import add\n\ndef test_add():\n    assert add(2, 3) == 5\n")
+
+    command = MutationEngine(str(target))._find_test_command()
+
+    assert _split_test_command(command) == ("python", "-m", "pytest", str(test_file), "-v")
+
+
+def test_detected_main_command_runs_target_with_space_and_quote_in_path(tmp_path):
+    target = _write_target(tmp_path)
+    engine = MutationEngine(str(target))
+
+    baseline = engine.run_baseline_tests()
+    assert baseline["passed"] is True, baseline
+
+    mutated = engine.run_tests_against_mutation(CALC_SOURCE.replace("a + b", "a - b"))
+    assert mutated["passed"] is False, mutated
+    assert target.read_text() == CALC_SOURCE
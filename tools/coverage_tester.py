@@ -1,46 +1,105 @@
 import ast
 import os
 import sys
+from io import StringIO
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from baml_client.sync_client import b
 from baml_client.types import PythonTestFile, CoverageAnalysis
-from utils import read_python_file, parse_python_ast
+from utils import write_python_file, load_python_file, split_source_lines, get_source_segment
+from utils.generated_test_writer import TEST_FILE_FOOTER, module_call_prefixer, request_concurrently, write_test_methods
 
 
-class CoverageAnalyzer(ast.NodeVisitor):
-    """AST visitor to analyze code coverage requirements."""
+_LOOP_NODES = (ast.For, ast.AsyncFor, ast.While)
+
+
+class _LoopContext:
+    """The innermost enclosing loop during the walk; break/continue are recorded once per loop."""
+    __slots__ = ('label', 'has_break', 'has_continue')
+    
+    def __init__(self, label: str):
+        self.label = label
+        self.has_break = False
+        self.has_continue = False
+
+
+def _format_paths(paths: list) -> list:
+    """Render (subject, variant) path tuples as the strings sent to BAML."""
+    return [subject if variant is None else f"{subject} ({variant})" for subject, variant in paths]
+
+
+class CoverageAnalyzer:
+    """
+    Single-pass AST walker to analyze code coverage requirements.
+    
+    Branches, loops and exception paths are stored as (subject, variant)
+    tuples, so each node's subject is built once and shared by its variants;
+    they are rendered to strings only when the CoverageAnalysis is built.
+    """
     
     def __init__(self, function_node: ast.FunctionDef):
         self.function_node = function_node
-        self.branches = []
-        self.loops = []
-        self.exception_paths = []
+        self.branches: list[tuple[str, str | None]] = []
+        self.loops: list[tuple[str, str | None]] = []
+        self.exception_paths: list[tuple[str, str | None]] = []
         self.return_statements = []
         self.parameters = []
-        self.current_depth = 0
+        # ast.unparse results keyed by node id; elif tests are seen twice
+        self._unparse_cache = {}
         
         # Extract function parameters
         for arg in function_node.args.args:
             param_info = arg.arg
             if arg.annotation:
-                try:
-                    param_info += f": {ast.unparse(arg.annotation)}"
-                except:
-                    param_info += ": <annotation>"
+                param_info += f": {self._unparse(arg.annotation, '<annotation>')}"
             self.parameters.append(param_info)
     
-    def visit_If(self, node: ast.If):
-        """Analyze if/elif/else branches."""
-        self.current_depth += 1
+    def analyze(self):
+        """
+        Walk the function once with an explicit stack, dispatching on node type.
         
+        Each stack entry carries the innermost enclosing loop, so break/continue
+        statements are attributed to their loop without re-walking the loop body.
+        """
+        handlers = self._HANDLERS
+        stack = [(self.function_node, None)]
+        while stack:
+            node, outer_loop = stack.pop()
+            handler = handlers.get(type(node))
+            loop = handler(self, node, outer_loop) if handler is not None else outer_loop
+            # Push children reversed so they are popped in source order
+            children = list(ast.iter_child_nodes(node))
+            children.reverse()
+            if isinstance(node, _LOOP_NODES) and node.orelse:
+                # A loop's else clause runs after the loop, in the outer loop's context
+                orelse_ids = set(map(id, node.orelse))
+                stack.extend((child, outer_loop if id(child) in orelse_ids else loop) for child in children)
+            else:
+                stack.extend((child, loop) for child in children)
+    
+    def _unparse(self, node: ast.AST, fallback: str) -> str:
+        """Return the source for node, memoized per node, or fallback if it can't be unparsed."""
+        key = id(node)
+        text = self._unparse_cache.get(key)
+        if text is None:
+            try:
+                text = ast.unparse(node)
+            except:
+                text = fallback
+            self._unparse_cache[key] = text
+        return text
+    
+    def _handle_scope(self, node: ast.AST, loop):
+        """Nested functions, lambdas and classes start a fresh loop context."""
+        return None
+    
+    def _handle_if(self, node: ast.If, loop):
+        """Analyze if/elif/else branches."""
         # Main if condition
-        try:
-            condition = ast.unparse(node.test)
-        except:
-            condition = "<complex_condition>"
+        condition = self._unparse(node.test, "<complex_condition>")
         
-        self.branches.append(f"if {condition} (True path)")
-        self.branches.append(f"if {condition} (False path)")
+        subject = f"if {condition}"
+        self.branches.append((subject, "True path"))
+        self.branches.append((subject, "False path"))
         
         # Process elif branches
         current = node
@@ -48,135 +107,146 @@ class CoverageAnalyzer(ast.NodeVisitor):
         while current.orelse and len(current.orelse) == 1 and isinstance(current.orelse[0], ast.If):
             elif_count += 1
             elif_node = current.orelse[0]
-            try:
-                elif_condition = ast.unparse(elif_node.test)
-            except:
-                elif_condition = f"<elif_condition_{elif_count}>"
+            elif_condition = self._unparse(elif_node.test, f"<elif_condition_{elif_count}>")
             
-            self.branches.append(f"elif {elif_condition} (True path)")
+            self.branches.append((f"elif {elif_condition}", "True path"))
             current = elif_node
         
         # Final else branch if it exists
         if current.orelse and not (len(current.orelse) == 1 and isinstance(current.orelse[0], ast.If)):
-            self.branches.append("else branch")
+            self.branches.append(("else branch", None))
         
-        self.generic_visit(node)
-        self.current_depth -= 1
+        return loop
     
-    def visit_While(self, node: ast.While):
+    def _handle_while(self, node: ast.While, loop):
         """Analyze while loops."""
-        try:
-            condition = ast.unparse(node.test)
-        except:
-            condition = "<while_condition>"
+        condition = self._unparse(node.test, "<while_condition>")
         
-        self.loops.append(f"while {condition} (zero iterations)")
-        self.loops.append(f"while {condition} (one iteration)")
-        self.loops.append(f"while {condition} (multiple iterations)")
-        
-        # Check for break and continue in loop body
-        for child in ast.walk(node):
-            if isinstance(child, ast.Break):
-                self.loops.append(f"while {condition} (early break)")
-            elif isinstance(child, ast.Continue):
-                self.loops.append(f"while {condition} (continue statement)")
-        
-        self.generic_visit(node)
+        label = f"while {condition}"
+        self.loops.append((label, "zero iterations"))
+        self.loops.append((label, "one iteration"))
+        self.loops.append((label, "multiple iterations"))
+        return _LoopContext(label)
     
-    def visit_For(self, node: ast.For):
+    def _handle_for(self, node: ast.For | ast.AsyncFor, loop):
         """Analyze for loops."""
-        try:
-            target = ast.unparse(node.target)
-            iter_expr = ast.unparse(node.iter)
-        except:
-            target = "<target>"
-            iter_expr = "<iterable>"
-        
-        self.loops.append(f"for {target} in {iter_expr} (empty iterable)")
-        self.loops.append(f"for {target} in {iter_expr} (single item)")
-        self.loops.append(f"for {target} in {iter_expr} (multiple items)")
+        target = self._unparse(node.target, "<target>")
+        iter_expr = self._unparse(node.iter, "<iterable>")
         
-        # Check for break and continue in loop body
-        for child in ast.walk(node):
-            if isinstance(child, ast.Break):
-                self.loops.append(f"for {target} in {iter_expr} (early break)")
-            elif isinstance(child, ast.Continue):
-                self.loops.append(f"for {target} in {iter_expr} (continue statement)")
+        label = f"for {target} in {iter_expr}"
+        self.loops.append((label, "empty iterable"))
+        self.loops.append((label, "single item"))
+        self.loops.append((label, "multiple items"))
         
         # Check for else clause
         if node.orelse:
-            self.loops.append(f"for {target} in {iter_expr} (else clause - no break)")
+            self.loops.append((label, "else clause - no break"))
         
-        self.generic_visit(node)
+        return _LoopContext(label)
     
-    def visit_Try(self, node: ast.Try):
+    def _handle_break(self, node: ast.Break, loop):
+        """Record an early exit from the enclosing loop."""
+        if loop is not None and not loop.has_break:
+            loop.has_break = True
+            self.loops.append((loop.label, "early break"))
+        return loop
+    
+    def _handle_continue(self, node: ast.Continue, loop):
+        """Record a continue statement in the enclosing loop."""
+        if loop is not None and not loop.has_continue:
+            loop.has_continue = True
+            self.loops.append((loop.label, "continue statement"))
+        return loop
+    
+    def _handle_try(self, node: ast.Try, loop):
         """Analyze try/except/finally blocks."""
-        self.exception_paths.append("try block (successful execution)")
+        self.exception_paths.append(("try block", "successful execution"))
         
         # Handle each except handler
         for i, handler in enumerate(node.handlers):
             if handler.type:
-                try:
-                    exc_type = ast.unparse(handler.type)
-                except:
-                    exc_type = f"<exception_type_{i}>"
+                exc_type = self._unparse(handler.type, f"<exception_type_{i}>")
             else:
                 exc_type = "Exception"
             
-            self.exception_paths.append(f"except {exc_type} block")
+            self.exception_paths.append((f"except {exc_type} block", None))
         
         # Handle finally block
         if node.finalbody:
-            self.exception_paths.append("finally block execution")
+            self.exception_paths.append(("finally block execution", None))
         
         # Handle else block (executes if no exception in try)
         if node.orelse:
-            self.exception_paths.append("try-else block (no exception)")
+            self.exception_paths.append(("try-else block", "no exception"))
         
-        self.generic_visit(node)
+        return loop
     
-    def visit_Return(self, node: ast.Return):
+    def _handle_return(self, node: ast.Return, loop):
         """Analyze return statements."""
         if node.value:
-            try:
-                return_expr = ast.unparse(node.value)
-            except:
-                return_expr = "<return_value>"
+            return_expr = self._unparse(node.value, "<return_value>")
         else:
             return_expr = "None"
         
         self.return_statements.append(f"return {return_expr}")
-        self.generic_visit(node)
+        return loop
     
-    def visit_With(self, node: ast.With):
+    def _handle_with(self, node: ast.With, loop):
         """Analyze with statements (context managers)."""
         for item in node.items:
-            try:
-                context_expr = ast.unparse(item.context_expr)
-            except:
-                context_expr = "<context_manager>"
+            context_expr = self._unparse(item.context_expr, "<context_manager>")
             
-            self.exception_paths.append(f"with {context_expr} (successful)")
-            self.exception_paths.append(f"with {context_expr} (exception in context)")
+            subject = f"with {context_expr}"
+            self.exception_paths.append((subject, "successful"))
+            self.exception_paths.append((subject, "exception in context"))
         
-        self.generic_visit(node)
+        return loop
     
-    def visit_Assert(self, node: ast.Assert):
+    def _handle_assert(self, node: ast.Assert, loop):
         """Analyze assert statements."""
-        try:
-            test_expr = ast.unparse(node.test)
-        except:
-            test_expr = "<assertion>"
+        test_expr = self._unparse(node.test, "<assertion>")
         
-        self.branches.append(f"assert {test_expr} (passes)")
-        self.exception_paths.append(f"assert {test_expr} (fails - AssertionError)")
-        self.generic_visit(node)
+        subject = f"assert {test_expr}"
+        self.branches.append((subject, "passes"))
+        self.exception_paths.append((subject, "fails - AssertionError"))
+        return loop
+    
+    _HANDLERS = {
+        ast.FunctionDef: _handle_scope,
+        ast.AsyncFunctionDef: _handle_scope,
+        ast.Lambda: _handle_scope,
+        ast.ClassDef: _handle_scope,
+        ast.If: _handle_if,
+        ast.While: _handle_while,
+        ast.For: _handle_for,
+        ast.AsyncFor: _handle_for,
+        ast.Break: _handle_break,
+        ast.Continue: _handle_continue,
+        ast.Try: _handle_try,
+        ast.Return: _handle_return,
+        ast.With: _handle_with,
+        ast.Assert: _handle_assert,
+    }
+
+
+def _collect_functions(tree: ast.AST) -> list:
+    """Return every FunctionDef in the tree in source order, using a single pass."""
+    functions = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.FunctionDef):
+            functions.append(node)
+        children = list(ast.iter_child_nodes(node))
+        children.reverse()
+        stack.extend(children)
+    return functions
 
 
 def analyze_function_coverage(source_code: str, function_node: ast.FunctionDef) -> CoverageAnalysis:
     """Analyze a function for comprehensive coverage requirements."""
     analyzer = CoverageAnalyzer(function_node)
-    analyzer.visit(function_node)
+    analyzer.analyze()
     
     # If no explicit return statements found, add implicit None return
     if not analyzer.return_statements:
@@ -184,118 +254,112 @@ def analyze_function_coverage(source_code: str, function_node: ast.FunctionDef)
     
     return CoverageAnalysis(
         function_name=function_node.name,
-        branches=analyzer.branches,
-        loops=analyzer.loops,
-        exception_paths=analyzer.exception_paths,
+        branches=_format_paths(analyzer.branches),
+        loops=_format_paths(analyzer.loops),
+        exception_paths=_format_paths(analyzer.exception_paths),
         return_statements=analyzer.return_statements,
         parameters=analyzer.parameters
     )
 
 
+def _request_coverage_tests(source_code: str, source_lines: list, function_node: ast.FunctionDef) -> tuple:
+    """
+    Analyze a function and ask BAML for coverage-focused tests.
+    
+    Returns (coverage_analysis, test_file, error), for request_concurrently.
+    """
+    coverage_analysis = None
+    try:
+        function_source = get_source_segment(source_lines, function_node)
+        
+        # Perform detailed coverage analysis
+        coverage_analysis = analyze_function_coverage(source_code, function_node)
+        
+        # Call BAML to generate coverage-focused tests
+        test_file: PythonTestFile = b.GenerateCoverageTests(
+            function_source, 
+            coverage_analysis
+        )
+        return coverage_analysis, test_file, None
+    except Exception as e:
+        return coverage_analysis, None, e
+
+
 def generate_coverage_tests(file_path: str) -> str:
     """
     Generate comprehensive test cases designed to achieve maximum code coverage.
     Analyzes the code structure and creates tests for all branches, loops, and edge cases.
     """
     try:
-        source_code = read_python_file(file_path)
-        tree = parse_python_ast(source_code)
+        source_code, tree = load_python_file(file_path)
     except (FileNotFoundError, SyntaxError) as e:
         return f"Error: {e}"
     
-    test_file_content = []
+    test_file_content = StringIO()
     module_name = os.path.splitext(os.path.basename(file_path))[0]
     
     # Find all functions in the file
-    functions_found = 0
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            functions_found += 1
-            function_source = ast.get_source_segment(source_code, node)
-            
-            try:
-                # Perform detailed coverage analysis
-                coverage_analysis = analyze_function_coverage(source_code, node)
-                
-                # Call BAML to generate coverage-focused tests
-                test_file: PythonTestFile = b.GenerateCoverageTests(
-                    function_source, 
-                    coverage_analysis
-                )
-                
-                # Format the generated tests
-                for test_case in test_file.test_cases:
-                    # Ensure test name starts with 'test_'
-                    test_name = test_case.name
-                    if not test_name.startswith('test_'):
-                        test_name = f'test_{test_name}'
-                    
-                    test_file_content.append(f"    def {test_name}(self):")
-                    
-                    # Process the body with proper indentation
-                    body_lines = test_case.body.split('\n')
-                    inside_with_block = False
-                    
-                    for line in body_lines:
-                        if not line.strip():
-                            test_file_content.append("")
-                            continue
-                        
-                        content = line.strip()
-                        
-                        # Add module prefix to function calls
-                        import re
-                        for func_node in ast.walk(tree):
-                            if isinstance(func_node, ast.FunctionDef):
-                                func_pattern = rf'\b{func_node.name}\('
-                                if re.search(func_pattern, content):
-                                    content = re.sub(func_pattern, f'{module_name}.{func_node.name}(', content)
-                        
-                        # Handle indentation based on context
-                        if content.startswith('with self.assertRaises'):
-                            inside_with_block = True
-                            test_file_content.append(f"        {content}")
-                        elif inside_with_block and not content.startswith(('with ', 'if ', 'for ', 'def ', 'class ', 'try:', 'except', 'finally:', 'else:')):
-                            test_file_content.append(f"            {content}")
-                        else:
-                            inside_with_block = False
-                            test_file_content.append(f"        {content}")
-                    
-                    test_file_content.append("")  # Blank line between tests
-                
-            except Exception as e:
-                # Fallback: create a comprehensive placeholder test
-                test_file_content.append(f"    def test_{node.name}_coverage_placeholder(self):")
-                test_file_content.append(f'        """Coverage test placeholder for {node.name}."""')
-                test_file_content.append(f"        # TODO: BAML generation failed: {str(e)[:100]}")
-                test_file_content.append(f"        # Function analysis showed: {len(coverage_analysis.branches) if 'coverage_analysis' in locals() else 0} branches, {len(coverage_analysis.loops) if 'coverage_analysis' in locals() else 0} loops")
-                test_file_content.append(f"        self.assertTrue(True)  # Placeholder assertion")
-                test_file_content.append("")
-    
+    functions = _collect_functions(tree)
+    functions_found = len(functions)
     if functions_found == 0:
         return f"No functions found in {file_path} to generate coverage tests for."
     
+    prefix_calls = module_call_prefixer(module_name, (func_node.name for func_node in functions))
+    
+    source_lines = split_source_lines(source_code)
+    generated = request_concurrently(lambda node: _request_coverage_tests(source_code, source_lines, node), functions)
+    
     # Collect all imports from BAML responses
-    all_imports = set(['import unittest', 'import coverage', f'import {module_name}'])
+    all_imports = set(['import inspect', 'import sys', 'import types', 'import unittest', f'import {module_name}'])
+    totals = {'branches': 0, 'loops': 0, 'exception_paths': 0}
+    
+    for node, (coverage_analysis, test_file, error) in zip(functions, generated):
+        if coverage_analysis is not None:
+            totals['branches'] += len(coverage_analysis.branches)
+            totals['loops'] += len(coverage_analysis.loops)
+            totals['exception_paths'] += len(coverage_analysis.exception_paths)
+        
+        try:
+            if error is not None:
+                raise error
+            
+            all_imports.update(test_file.imports)
+            
+            # Format the generated tests
+            write_test_methods(test_file_content, test_file.test_cases, prefix_calls)
+            
+        except Exception as e:
+            # Fallback: create a comprehensive placeholder test
+            test_file_content.write(f"    def test_{node.name}_coverage_placeholder(self):\n")
+            test_file_content.write(f'        """Coverage test placeholder for {node.name}."""\n')
+            test_file_content.write(f"        # TODO: BAML generation failed: {str(e)[:100]}\n")
+            test_file_content.write(f"        # Function analysis showed: {len(coverage_analysis.branches) if coverage_analysis else 0} branches, {len(coverage_analysis.loops) if coverage_analysis else 0} loops\n")
+            test_file_content.write(f"        self.assertTrue(True)  # Placeholder assertion\n")
+            test_file_content.write("\n")
     
     # Create the complete test file
     class_name_parts = [part.capitalize() for part in module_name.split('_')]
     class_name = "".join(class_name_parts)
     
-    # Collect imports from BAML responses
-    try:
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                function_source = ast.get_source_segment(source_code, node)
-                coverage_analysis = analyze_function_coverage(source_code, node)
-                test_file: PythonTestFile = b.GenerateCoverageTests(function_source, coverage_analysis)
-                all_imports.update(test_file.imports)
-    except:
-        pass  # If import collection fails, continue with basic imports
-    
     imports_section = '\n'.join(sorted(all_imports))
     
-    full_test_file = f"""{imports_section}
+    test_file_header = f"""{imports_section}
+
+
+def _module_code_objects(module):
+    \"\"\"Return the code objects of the module's functions and methods, nested ones included.\"\"\"
+    candidates = []
+    for value in vars(module).values():
+        if getattr(value, '__module__', None) == module.__name__:
+            candidates.extend(vars(value).values() if isinstance(value, type) else [value])
+    stack = [getattr(inspect.unwrap(getattr(c, '__func__', c)), '__code__', None) for c in candidates]
+    code_objects = set()
+    while stack:
+        code = stack.pop()
+        if isinstance(code, types.CodeType) and code not in code_objects:
+            code_objects.add(code)
+            stack.extend(code.co_consts)
+    return code_objects
 
 
 class TestCoverage{class_name}(unittest.TestCase):
@@ -307,35 +371,74 @@ class TestCoverage{class_name}(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         \"\"\"Set up coverage measurement for the test suite.\"\"\"
-        cls.cov = coverage.Coverage()
-        cls.cov.start()
+        monitoring = getattr(sys, 'monitoring', None)
+        if monitoring is not None and monitoring.get_tool(monitoring.COVERAGE_ID) is None:
+            # Python 3.12+: interpreter LINE events, each disabled after its first hit
+            cls.cov = None
+            cls.covered_lines = set()
+            cls.code_objects = _module_code_objects({module_name})
+            monitoring.use_tool_id(monitoring.COVERAGE_ID, "test_coverage_{module_name}")
+            monitoring.register_callback(monitoring.COVERAGE_ID, monitoring.events.LINE, cls._record_line)
+            for code in cls.code_objects:
+                monitoring.set_local_events(monitoring.COVERAGE_ID, code, monitoring.events.LINE)
+        else:
+            import coverage
+            cls.cov = coverage.Coverage()
+            cls.cov.start()
+    
+    @classmethod
+    def _record_line(cls, code, line_number):
+        \"\"\"sys.monitoring LINE callback.\"\"\"
+        cls.covered_lines.add(line_number)
+        return sys.monitoring.DISABLE
     
     @classmethod
     def tearDownClass(cls):
         \"\"\"Stop coverage measurement and generate report.\"\"\"
-        cls.cov.stop()
-        cls.cov.save()
+        if cls.cov is None:
+            monitoring = sys.monitoring
+            for code in cls.code_objects:
+                monitoring.set_local_events(monitoring.COVERAGE_ID, code, 0)
+            monitoring.register_callback(monitoring.COVERAGE_ID, monitoring.events.LINE, None)
+            monitoring.free_tool_id(monitoring.COVERAGE_ID)
+        else:
+            cls.cov.stop()
+            cls.cov.save()
         
         # Print coverage report
         print("\\n" + "="*50)
         print("COVERAGE REPORT")
         print("="*50)
-        cls.cov.report(show_missing=True)
+        if cls.cov is None:
+            # Function body lines; the def line itself raises no LINE event
+            lines = {{
+                line
+                for code in cls.code_objects
+                for _, _, line in code.co_lines()
+                if line is not None and line != code.co_firstlineno
+            }}
+            missing = sorted(lines - cls.covered_lines)
+            percent = 100.0 * (len(lines) - len(missing)) / len(lines) if lines else 100.0
+            print(f"{{{module_name}.__file__}}: {{len(lines) - len(missing)}}/{{len(lines)}} lines covered ({{percent:.0f}}%)")
+            if missing:
+                print("Missing: " + ", ".join(map(str, missing)))
+        else:
+            cls.cov.report(show_missing=True)
         
         # Get coverage percentage
         print("\\nTotal Coverage: See report above")
         print("="*50)
 
-{chr(10).join(test_file_content)}
-if __name__ == '__main__':
-    unittest.main()
 """
+    full_test_file = "".join([test_file_header, test_file_content.getvalue(), TEST_FILE_FOOTER])
     
     # Save the test file
     test_file_name = f"test_coverage_{module_name}.py"
     test_file_path = os.path.join(os.path.dirname(file_path), test_file_name)
     
-    with open(test_file_path, 'w') as f:
-        f.write(full_test_file.strip())
+    try:
+        write_python_file(test_file_path, full_test_file.strip())
+    except SyntaxError as e:
+        return f"Error: Generated coverage tests for {file_path} are not valid Python (line {e.lineno}: {e.msg}): {(e.text or '').strip()}"
     
-    return f"Successfully generated comprehensive coverage tests at {test_file_path}\\nFound {functions_found} functions with detailed coverage analysis including:\\n- {sum(len(getattr(analyze_function_coverage(read_python_file(file_path), node), 'branches', [])) for node in ast.walk(parse_python_ast(read_python_file(file_path))) if isinstance(node, ast.FunctionDef))} branch conditions\\n- {sum(len(getattr(analyze_function_coverage(read_python_file(file_path), node), 'loops', [])) for node in ast.walk(parse_python_ast(read_python_file(file_path))) if isinstance(node, ast.FunctionDef))} loop scenarios\\n- {sum(len(getattr(analyze_function_coverage(read_python_file(file_path), node), 'exception_paths', [])) for node in ast.walk(parse_python_ast(read_python_file(file_path))) if isinstance(node, ast.FunctionDef))} exception paths"
\ No newline at end of file
+    return f"Successfully generated comprehensive coverage tests at {test_file_path}\\nFound {functions_found} functions with detailed coverage analysis including:\\n- {totals['branches']} branch conditions\\n- {totals['loops']} loop scenarios\\n- {totals['exception_paths']} exception paths"
\ No newline at end of file
@@ -1,12 +1,223 @@
 import ast
+import collections
+import functools
 import os
 import importlib.util
+import logging
+import re
 import sys
 import traceback
+import multiprocessing
+from multiprocessing import TimeoutError as PoolTimeoutError
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; workers run without a memory cap
+    resource = None
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from baml_client.sync_client import b
 from baml_client.types import FuzzInput
-from utils import read_python_file, parse_python_ast
+from utils import load_python_file, split_source_lines, get_source_segment
+
+logger = logging.getLogger(__name__)
+
+FUZZ_TIMEOUT_SECONDS = 2.0
+# Extra address space a pool worker may map beyond what it inherited
+FUZZ_MEMORY_LIMIT_BYTES = 1 << 30
+MAX_REPORTED_CRASHES = 100
+MAX_REPORTED_VALUE_CHARS = 1000
+
+# Fuzzing runs in a server worker thread, and forking a multi-threaded process
+# can deadlock the child, so pool workers are started from a forkserver (or
+# spawned where there is none); _init_worker imports the target in each worker
+_POOL_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# Plain decimal literals are parsed with int()/float() instead of ast.literal_eval
+_INT_LITERAL = re.compile(r'-?(?:0|[1-9][0-9]*)')
+_FLOAT_LITERAL = re.compile(r'-?(?:0|[1-9][0-9]*)\.[0-9]+')
+_UNPARSEABLE = object()
+# parse_cache miss marker, distinct from a cached None (the literal "None")
+_UNPARSED = object()
+
+
+def _parse_fuzz_literal(raw: str):
+    """Parse a BAML fuzz input string into a Python value, or return _UNPARSEABLE."""
+    try:
+        if _INT_LITERAL.fullmatch(raw):
+            return int(raw)
+        if _FLOAT_LITERAL.fullmatch(raw):
+            return float(raw)
+        return ast.literal_eval(raw)
+    except Exception:
+        # Includes ints beyond sys.get_int_max_str_digits()
+        return _UNPARSEABLE
+
+
+def _dedup_key(value):
+    """
+    Key identifying value among the parsed fuzz inputs.
+    
+    Usually its repr; values whose repr refuses to build (e.g. hex literals
+    that parse to ints beyond sys.get_int_max_str_digits()) are keyed by
+    identity, so they are never treated as duplicates.
+    """
+    try:
+        return repr(value)
+    except ValueError:
+        return (type(value), id(value))
+
+
+def _bounded_str(value, limit: int = MAX_REPORTED_VALUE_CHARS) -> str:
+    """str(value) truncated to limit characters, for inputs and errors in the crash report."""
+    try:
+        text = str(value)
+    except ValueError:
+        # Ints beyond sys.get_int_max_str_digits() refuse conversion
+        return f"<{type(value).__name__} too large to display>"
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...[truncated {len(text) - limit} chars]"
+
+
+@functools.lru_cache(maxsize=128)
+def _load_module(file_path: str, mtime_ns: int):
+    """
+    Import the module at file_path.
+    
+    Cached per process (including pool workers); the modification time is part
+    of the key so an edited file is executed again rather than served stale.
+    """
+    module_name = os.path.splitext(os.path.basename(file_path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_fuzz_inputs(function_source: str) -> tuple:
+    """
+    Generate fuzz inputs for a function's source with BAML.
+    
+    Cached for the life of the server process, so fuzzing an unchanged
+    function again skips the LLM call.
+    """
+    return tuple(b.GenerateFuzzInputs(function_source))
+
+
+def _load_target(file_path: str, function_name: str):
+    """Return the named function from the (cached) module at file_path."""
+    module = _load_module(file_path, os.stat(file_path).st_mtime_ns)
+    return getattr(module, function_name)
+
+
+# The function under test, bound once per pool worker by _init_worker
+_worker_target = None
+
+
+def _limit_worker_memory():
+    """
+    Cap the worker's address space so an oversized input fails with MemoryError.
+    
+    The limit is relative to the mappings the worker already holds (the
+    interpreter and its imported modules), which vary between environments.
+    """
+    if resource is None:
+        return
+    try:
+        with open('/proc/self/statm') as f:
+            in_use = int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = in_use + FUZZ_MEMORY_LIMIT_BYTES
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    if soft == resource.RLIM_INFINITY or soft > limit:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _init_worker(file_path: str, function_name: str):
+    """Pool initializer: cap memory, then import the target once so each input is a plain call."""
+    global _worker_target
+    _limit_worker_memory()
+    _worker_target = _load_target(file_path, function_name)
+
+
+def _invoke_target(fuzz_input, function_to_test=None):
+    """
+    Call the target function (the worker's bound target by default) with a single fuzz input.
+    
+    Returns (exception type name, error text) on a crash, where the text is
+    the exception type and message (the full traceback when FUZZ_FULL_TB is
+    set), otherwise None.
+    """
+    if function_to_test is None:
+        function_to_test = _worker_target
+    try:
+        if isinstance(fuzz_input, tuple):
+            function_to_test(*fuzz_input)
+        else:
+            function_to_test(fuzz_input)
+    except Exception as e:
+        if os.environ.get('FUZZ_FULL_TB'):
+            return type(e).__name__, traceback.format_exc()
+        return type(e).__name__, ''.join(traceback.format_exception_only(e))
+    return None
+
+
+def _run_fuzz_inputs(file_path: str, function_name: str, fuzz_input_values: list) -> list:
+    """
+    Execute every fuzz input across a process pool, enforcing a per-input timeout.
+    
+    Returns the (type, error) pair for each input (None when the call succeeded), in input order.
+    """
+    errors = [None] * len(fuzz_input_values)
+    remaining = list(range(len(fuzz_input_values)))
+    
+    while remaining:
+        processes = min(os.cpu_count() or 1, len(remaining))
+        with _POOL_CONTEXT.Pool(processes=processes, initializer=_init_worker, initargs=(file_path, function_name)) as pool:
+            pending = [
+                (index, pool.apply_async(_invoke_target, (fuzz_input_values[index],)))
+                for index in remaining
+            ]
+            remaining = []
+            for position, (index, result) in enumerate(pending):
+                try:
+                    errors[index] = result.get(timeout=FUZZ_TIMEOUT_SECONDS)
+                except PoolTimeoutError:
+                    errors[index] = ("TimeoutError", f"TimeoutError: no result within {FUZZ_TIMEOUT_SECONDS} seconds\n")
+                    # A hung worker can't be reclaimed: keep finished results and
+                    # rerun everything else in a fresh pool
+                    for later_index, later_result in pending[position + 1:]:
+                        if later_result.ready():
+                            errors[later_index] = later_result.get()
+                        else:
+                            remaining.append(later_index)
+                    break
+    
+    return errors
+
+
+@functools.lru_cache(maxsize=128)
+def _function_index(tree: ast.Module) -> dict:
+    """
+    Map names to fuzzable functions: the module's top-level functions.
+    
+    Methods and nested functions are left out, since the target is resolved
+    with getattr on the imported module. Keyed on the tree itself, which
+    load_python_file shares while the file is unchanged.
+    """
+    index = {}
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            index.setdefault(node.name, node)
+    return index
+
 
 def fuzz_test_function(file_path: str, function_name: str) -> str:
     """
@@ -14,37 +225,54 @@ def fuzz_test_function(file_path: str, function_name: str) -> str:
     It uses Gemini to generate intelligent fuzzing inputs.
     """
     try:
-        source_code = read_python_file(file_path)
-        tree = parse_python_ast(source_code)
+        source_code, tree = load_python_file(file_path)
     except (FileNotFoundError, SyntaxError) as e:
         return f"Error: {e}"
 
     function_source = None
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) and node.name == function_name:
-            function_source = ast.get_source_segment(source_code, node)
-            break
+    function_node = _function_index(tree).get(function_name)
+    if function_node is not None:
+        function_source = get_source_segment(split_source_lines(source_code), function_node)
 
     if not function_source:
         return f"Error: Function '{function_name}' not found in {file_path}"
 
+    # Import once up front, before spending an LLM call, so a broken module is
+    # reported here rather than failing inside every pool worker's initializer
+    try:
+        function_to_test = _load_target(file_path, function_name)
+    except Exception as e:
+        return f"Error: Could not load '{function_name}' from {file_path}: {e}"
+
     try:
         # Call the BAML function to generate the fuzzing inputs
-        fuzz_inputs: list[FuzzInput] = b.GenerateFuzzInputs(function_source)
+        if os.environ.get('FUZZ_NO_CACHE'):
+            fuzz_inputs: list[FuzzInput] = b.GenerateFuzzInputs(function_source)
+        else:
+            fuzz_inputs = _cached_fuzz_inputs(function_source)
         
         fuzz_input_values = []
         parsing_errors = 0
-        for i, fuzz_input in enumerate(fuzz_inputs):
-            try:
-                parsed_value = ast.literal_eval(fuzz_input.value)
-                fuzz_input_values.append(parsed_value)
-            except Exception as parse_error:
+        parse_cache = {}
+        seen_values = set()
+        for fuzz_input in fuzz_inputs:
+            raw = fuzz_input.value
+            parsed_value = parse_cache.get(raw, _UNPARSED)
+            if parsed_value is _UNPARSED:
+                parsed_value = parse_cache[raw] = _parse_fuzz_literal(raw)
+            if parsed_value is _UNPARSEABLE:
                 parsing_errors += 1
                 # Skip inputs that can't be parsed
                 continue
+            # Identical values would only repeat the same call
+            key = _dedup_key(parsed_value)
+            if key in seen_values:
+                continue
+            seen_values.add(key)
+            fuzz_input_values.append(parsed_value)
         
         if parsing_errors > 0:
-            print(f"Warning: Skipped {parsing_errors} fuzzing inputs due to parsing errors")
+            logger.warning("Skipped %d fuzzing inputs due to parsing errors", parsing_errors)
         
         if not fuzz_input_values:
             return f"Error: No valid fuzzing inputs could be parsed from BAML response"
@@ -52,32 +280,29 @@ def fuzz_test_function(file_path: str, function_name: str) -> str:
     except Exception as e:
         return f"Error generating fuzzing inputs from BAML: {e}"
 
-    module_name = os.path.splitext(os.path.basename(file_path))[0]
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    function_to_test = getattr(module, function_name)
-
-    crashes = []
-    for i, fuzz_input in enumerate(fuzz_input_values):
-        try:
-            if isinstance(fuzz_input, tuple):
-                function_to_test(*fuzz_input)
-            else:
-                function_to_test(fuzz_input)
-        except Exception as e:
-            crashes.append({
-                "input": fuzz_input,
-                "error": traceback.format_exc()
-            })
+    try:
+        errors = _run_fuzz_inputs(file_path, function_name, fuzz_input_values)
+    except (OSError, ImportError):
+        # No process pool available on this platform, run in-process instead
+        errors = [_invoke_target(fuzz_input, function_to_test) for fuzz_input in fuzz_input_values]
+
+    crashes = [
+        {"input": fuzz_input, "type": error[0], "error": error[1]}
+        for fuzz_input, error in zip(fuzz_input_values, errors)
+        if error is not None
+    ]
 
     if not crashes:
         return f"Fuzz testing completed for '{function_name}'. No crashes found in {len(fuzz_input_values)} test cases."
 
-    result = f"Fuzz testing for '{function_name}' found {len(crashes)} crash(es):\n\n"
-    for crash in crashes:
-        result += f"- Input: {crash['input']}\n"
-        result += f"  Error: {crash['error']}\n"
+    parts = [f"Fuzz testing for '{function_name}' found {len(crashes)} crash(es):\n\n"]
+    # Crashes usually cluster on a few exception types; lead with the counts
+    type_counts = collections.Counter(crash["type"] for crash in crashes)
+    parts.append("By exception type: " + ", ".join(f"{name} ({count})" for name, count in type_counts.most_common()) + "\n\n")
+    for crash in crashes[:MAX_REPORTED_CRASHES]:
+        parts.append(f"- Input: {_bounded_str(crash['input'])}\n")
+        parts.append(f"  Error: {_bounded_str(crash['error'])}\n")
+    if len(crashes) > MAX_REPORTED_CRASHES:
+        parts.append(f"... and {len(crashes) - MAX_REPORTED_CRASHES} more crash(es) not shown\n")
 
-    return result
\ No newline at end of file
+    return "".join(parts)
\ No newline at end of file
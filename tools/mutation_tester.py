@@ -1,3 +1,4 @@
+import logging
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -5,8 +6,19 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from typing import Dict, List, Optional
 from pathlib import Path
 
+from utils.mutation_engine import format_test_command
 from utils.mutation_test_executor import MutationTestExecutor
-from baml_client import b
+
+logger = logging.getLogger(__name__)
+
+
+def _check_python_file(file_path: str) -> Optional[str]:
+    """Return an error message unless file_path is an existing .py file (the suffix is checked first, without a syscall)."""
+    if not file_path.endswith('.py'):
+        return f"Error: File must be a Python file (.py): {file_path}"
+    if not os.path.isfile(file_path):
+        return f"Error: File not found: {file_path}"
+    return None
 
 
 def run_mutation_testing(file_path: str, test_command: Optional[str] = None, max_mutations: int = 15) -> str:
@@ -23,12 +35,10 @@ def run_mutation_testing(file_path: str, test_command: Optional[str] = None, max
     """
     try:
         # Validate file exists and is readable
-        file_path = str(Path(file_path).resolve())
-        if not Path(file_path).exists():
-            return f"Error: File not found: {file_path}"
-        
-        if not file_path.endswith('.py'):
-            return f"Error: File must be a Python file (.py): {file_path}"
+        file_path = os.path.abspath(file_path)
+        error = _check_python_file(file_path)
+        if error:
+            return error
         
         # Initialize mutation test executor
         executor = MutationTestExecutor(file_path)
@@ -36,15 +46,15 @@ def run_mutation_testing(file_path: str, test_command: Optional[str] = None, max
         # Check if test files exist - if not, just generate mutations for analysis
         test_files = executor.find_test_files()
         if not test_files and not test_command:
-            print(f"No test files found for {Path(file_path).name}. Generating mutations for analysis only...")
+            logger.info("No test files found for %s. Generating mutations for analysis only...", Path(file_path).name)
             results = executor.run_mutation_generation_only()
             return _generate_analysis_only_report(results)
         
         # Run full mutation testing with tests
-        print(f"Running mutation testing on {Path(file_path).name}...")
+        logger.info("Running mutation testing on %s...", Path(file_path).name)
         if test_files and not test_command:
-            test_command = f"python -m pytest {test_files[0]} -v"
-            print(f"Using test command: {test_command}")
+            test_command = format_test_command(["python", "-m", "pytest", test_files[0], "-v"])
+            logger.info("Using test command: %s", test_command)
         
         results = executor.run_full_mutation_testing(test_command, max_mutations)
         
@@ -67,12 +77,10 @@ def run_mutation_analysis_only(file_path: str) -> str:
         String with mutation analysis and recommendations
     """
     try:
-        file_path = str(Path(file_path).resolve())
-        if not Path(file_path).exists():
-            return f"Error: File not found: {file_path}"
-        
-        if not file_path.endswith('.py'):
-            return f"Error: File must be a Python file (.py): {file_path}"
+        file_path = os.path.abspath(file_path)
+        error = _check_python_file(file_path)
+        if error:
+            return error
         
         executor = MutationTestExecutor(file_path)
         results = executor.run_mutation_generation_only()
@@ -92,7 +100,7 @@ def _generate_analysis_only_report(results: Dict) -> str:
     total_mutations = results.get("total_mutations", 0)
     source_code = results.get("source_code", "")
     
-    report = f"""# Mutation Analysis Report
+    parts = [f"""# Mutation Analysis Report
 
 **File:** `{results.get('target_file', 'Unknown')}`  
 **Total Mutations Generated:** {total_mutations}
@@ -103,29 +111,26 @@ This analysis shows potential mutations that could be used to test your code qua
 ## Generated Mutations ({total_mutations})
 These mutations represent potential changes that could reveal test coverage gaps:
 
-"""
+"""]
     
     if mutations:
         # Group mutations by operator type for better organization
         operator_groups = {}
         for mutation in mutations:
-            operator = mutation.get('operator', 'Unknown')
-            if operator not in operator_groups:
-                operator_groups[operator] = []
-            operator_groups[operator].append(mutation)
+            operator_groups.setdefault(mutation.get('operator', 'Unknown'), []).append(mutation)
         
         for operator, group_mutations in operator_groups.items():
-            report += f"### {operator.replace('Mutator', '')} Mutations ({len(group_mutations)})\n"
+            parts.append(f"### {operator.replace('Mutator', '')} Mutations ({len(group_mutations)})\n")
             for i, mutation in enumerate(group_mutations[:5], 1):  # Limit to 5 per group
-                report += f"{i}. **Line {mutation.get('line_number', '?')}:** "
-                report += f"`{mutation.get('original', 'Unknown')}` → `{mutation.get('mutated', 'Unknown')}`\n"
+                parts.append(f"{i}. **Line {mutation.get('line_number', '?')}:** ")
+                parts.append(f"`{mutation.get('original', 'Unknown')}` → `{mutation.get('mutated', 'Unknown')}`\n")
             
             if len(group_mutations) > 5:
-                report += f"   ... and {len(group_mutations) - 5} more\n"
-            report += "\n"
+                parts.append(f"   ... and {len(group_mutations) - 5} more\n")
+            parts.append("\n")
     
     # Add recommendations
-    report += """## 🎯 Recommendations
+    parts.append("""## 🎯 Recommendations
 
 To improve your code quality, consider:
 
@@ -145,6 +150,6 @@ To improve your code quality, consider:
 1. Create test files for this code
 2. Run mutation testing again with: `run mutation testing on this file`
 3. Aim for a mutation score of 80% or higher
-"""
+""")
     
-    return report
\ No newline at end of file
+    return "".join(parts)
\ No newline at end of file
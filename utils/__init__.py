@@ -1,4 +1,4 @@
 from .ai_clients import get_gemini_client
-from .file_handlers import read_python_file, parse_python_ast
+from .file_handlers import read_python_file, write_python_file, parse_python_ast, load_python_file, split_source_lines, get_source_segment
 
-__all__ = ['get_gemini_client', 'read_python_file', 'parse_python_ast']
\ No newline at end of file
+__all__ = ['get_gemini_client', 'read_python_file', 'write_python_file', 'parse_python_ast', 'load_python_file', 'split_source_lines', 'get_source_segment']
\ No newline at end of file
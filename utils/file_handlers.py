@@ -1,5 +1,16 @@
 import ast
+import functools
 import os
+import re
+import tempfile
+from typing import List, Optional, Tuple
+
+# Same line breaks the tokenizer recognizes (str.splitlines also splits on \f, \v, ...)
+_SOURCE_LINE = re.compile(r'[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+')
+
+# Process umask, read once at import (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 def read_python_file(file_path: str) -> str:
     """
@@ -21,6 +32,40 @@ def read_python_file(file_path: str) -> str:
     with open(file_path, 'r', encoding='utf-8') as f:
         return f.read()
 
+def write_python_file(file_path: str, source_code: str) -> None:
+    """
+    Validate Python source and write it atomically.
+    
+    The source is compiled first so a malformed file is never written, then
+    saved to a uniquely named temporary file beside the target and renamed
+    over it. The temporary file is removed if writing or renaming fails.
+    
+    Args:
+        file_path (str): Destination path
+        source_code (str): Python source code to write
+        
+    Raises:
+        SyntaxError: If the source code has syntax errors
+    """
+    compile(source_code, file_path, 'exec', dont_inherit=True)
+    
+    tmp_file = tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', dir=os.path.dirname(os.path.abspath(file_path)),
+        prefix=f".{os.path.basename(file_path)}.", suffix='.tmp', delete=False
+    )
+    try:
+        with tmp_file:
+            tmp_file.write(source_code)
+        # The temporary file is created owner-only; give it the mode open() would
+        os.chmod(tmp_file.name, 0o666 & ~_UMASK)
+        os.replace(tmp_file.name, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_file.name)
+        except OSError:
+            pass
+        raise
+
 def parse_python_ast(source_code: str) -> ast.AST:
     """
     Parse Python source code and return its AST.
@@ -37,4 +82,74 @@ def parse_python_ast(source_code: str) -> ast.AST:
     try:
         return ast.parse(source_code)
     except SyntaxError as e:
-        raise SyntaxError(f"Invalid Python syntax: {e}")
\ No newline at end of file
+        raise SyntaxError(f"Invalid Python syntax: {e}")
+
+def load_python_file(file_path: str) -> Tuple[str, ast.AST]:
+    """
+    Read and parse a Python file, reusing the result while the file is unchanged.
+    
+    Results are cached per process, keyed by the file's path, modification
+    time and size. The returned tree is shared between callers and must not
+    be modified.
+    
+    Args:
+        file_path (str): Path to the Python file
+        
+    Returns:
+        Tuple[str, ast.AST]: The file's source code and its AST
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        SyntaxError: If the source code has syntax errors
+    """
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}")
+    return _load_python_file(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=64)
+def _load_python_file(abs_path: str, mtime_ns: int, size: int) -> Tuple[str, ast.AST]:
+    source_code = read_python_file(abs_path)
+    return source_code, parse_python_ast(source_code)
+
+def split_source_lines(source_code: str) -> List[str]:
+    """
+    Split source code into lines (keeping line endings) once, for repeated segment lookups.
+    
+    Args:
+        source_code (str): Python source code
+        
+    Returns:
+        List[str]: Lines of the source, numbered the same way as AST line numbers
+    """
+    return _SOURCE_LINE.findall(source_code)
+
+def get_source_segment(source_lines: List[str], node: ast.AST) -> Optional[str]:
+    """
+    Return the source text for an AST node by slicing pre-split lines.
+    
+    Equivalent to ast.get_source_segment, but without re-splitting the whole
+    source on every call.
+    
+    Args:
+        source_lines (List[str]): Lines returned by split_source_lines
+        node (ast.AST): Node with position information
+        
+    Returns:
+        Optional[str]: Source text of the node, or None if it has no end position
+    """
+    end_lineno = getattr(node, 'end_lineno', None)
+    end_col_offset = getattr(node, 'end_col_offset', None)
+    if end_lineno is None or end_col_offset is None:
+        return None
+    
+    # Column offsets are UTF-8 byte offsets
+    lineno = node.lineno - 1
+    end_lineno -= 1
+    if lineno == end_lineno:
+        return source_lines[lineno].encode()[node.col_offset:end_col_offset].decode()
+    
+    first = source_lines[lineno].encode()[node.col_offset:].decode()
+    last = source_lines[end_lineno].encode()[:end_col_offset].decode()
+    return first + ''.join(source_lines[lineno + 1:end_lineno]) + last
\ No newline at end of file
@@ -0,0 +1,99 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TextIO
+
+MAX_BAML_WORKERS = 8
+
+INDENT4 = " " * 4
+INDENT8 = " " * 8
+INDENT12 = " " * 12
+TEST_FILE_FOOTER = "if __name__ == '__main__':\n    unittest.main()\n"
+TEST_PREFIX = 'test_'
+# First words of lines that start a new block and so end an assertRaises body
+BLOCK_KEYWORDS = frozenset(('with', 'if', 'for', 'def', 'class', 'try', 'except', 'finally', 'else'))
+# Leading word of a line, ending at whitespace, '(' or ':' (e.g. 'except(ValueError):')
+_FIRST_WORD = re.compile(r'\w*')
+
+def request_concurrently(request: Callable, function_nodes: List) -> List:
+    """
+    Call request(node) for every function node and return the results in source order.
+    
+    BAML calls are network-bound and independent per function, so they are
+    issued from a thread pool. request should return errors rather than raise
+    them, so one failing function doesn't abort the pool.
+    
+    Args:
+        request (Callable): Called with each function node
+        function_nodes (List): Function nodes to generate tests for
+    
+    Returns:
+        List: request's result for each node, in the order given
+    """
+    with ThreadPoolExecutor(max_workers=min(MAX_BAML_WORKERS, len(function_nodes))) as executor:
+        return list(executor.map(request, function_nodes))
+
+def module_call_prefixer(module_name: str, function_names: Iterable[str]) -> Callable[[str], str]:
+    """
+    Build a function that prefixes calls to the module's functions with the module name.
+    
+    One precompiled alternation matches a call to any of the functions, so
+    each generated line is scanned once.
+    
+    Args:
+        module_name (str): Name the generated tests import the module as
+        function_names (Iterable[str]): Functions defined in the module
+    
+    Returns:
+        Callable[[str], str]: Maps a line of test code to the prefixed line
+    """
+    func_names = dict.fromkeys(function_names)
+    call_pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, func_names)) + r')\(')
+    add_module_prefix = lambda match: f'{module_name}.{match.group(0)}'
+    return lambda content: call_pattern.sub(add_module_prefix, content)
+
+def write_test_methods(test_file_content: TextIO, test_cases: Iterable, prefix_calls: Callable[[str], str]) -> None:
+    """
+    Write BAML test cases as methods of the generated unittest.TestCase.
+    
+    Names get the 'test_' prefix if missing. Each body line is stripped,
+    passed through prefix_calls and re-indented; lines after a
+    'with self.assertRaises' go inside that block until one starts a new block.
+    
+    Args:
+        test_file_content (TextIO): Buffer the test class body is written to
+        test_cases (Iterable): BAML TestCase objects with name and body
+        prefix_calls (Callable[[str], str]): From module_call_prefixer
+    """
+    for test_case in test_cases:
+        # Ensure test name starts with 'test_'
+        test_name = test_case.name
+        if not test_name.startswith(TEST_PREFIX):
+            test_name = TEST_PREFIX + test_name
+        
+        test_file_content.writelines((INDENT4, "def ", test_name, "(self):\n"))
+        
+        # Process the body line by line with proper indentation handling
+        inside_with_block = False
+        for line in test_case.body.split('\n'):
+            if not line.strip():
+                test_file_content.write("\n")
+                continue
+            
+            # Remove any existing indentation, then add the module prefix to
+            # calls of functions in the source file
+            content = prefix_calls(line.strip())
+            
+            # Determine proper indentation
+            if content.startswith('with self.assertRaises'):
+                # This starts a with block
+                inside_with_block = True
+                test_file_content.writelines((INDENT8, content, "\n"))
+            elif inside_with_block and _FIRST_WORD.match(content).group() not in BLOCK_KEYWORDS:
+                # This line should be inside the with block (indented further)
+                test_file_content.writelines((INDENT12, content, "\n"))
+            else:
+                # Normal method body line or start of new block
+                inside_with_block = False
+                test_file_content.writelines((INDENT8, content, "\n"))
+        
+        test_file_content.write("\n")  # Add blank line between tests
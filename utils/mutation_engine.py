@@ -1,17 +1,115 @@
 import ast
+import collections
+import copy
+import functools
+import hashlib
+import itertools
+import logging
+import math
 import sys
 import os
+import shlex
 import tempfile
 import subprocess
 import shutil
-from typing import Dict, List, Optional, Tuple, Any
+import signal
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from pathlib import Path
 import importlib.util
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.file_handlers import split_source_lines
+
+logger = logging.getLogger(__name__)
+
+# Default limit for one run of the test command
+DEFAULT_TEST_TIMEOUT_SECONDS = 30.0
+
+# Test output kept per mutant; the tail holds the failures and the summary
+MAX_CAPTURED_OUTPUT_CHARS = 256 * 1024
+
+_BINOP_PRECEDENCE = {
+    ast.BitOr: 6, ast.BitXor: 7, ast.BitAnd: 8, ast.LShift: 9, ast.RShift: 9,
+    ast.Add: 10, ast.Sub: 10, ast.Mult: 11, ast.MatMult: 11, ast.Div: 11,
+    ast.FloorDiv: 11, ast.Mod: 11, ast.Pow: 13,
+}
+
+
+# Leaf nodes that never contain a mutation site: expression contexts and the
+# operator singletons shared by every BinOp/BoolOp/Compare/UnaryOp
+_LEAF_NODE_TYPES = frozenset(
+    leaf_type
+    for base in (ast.expr_context, ast.operator, ast.boolop, ast.cmpop, ast.unaryop)
+    for leaf_type in base.__subclasses__()
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _split_test_command(test_command: str) -> Tuple[str, ...]:
+    """
+    Split a test command into arguments, shell-style on POSIX so quoted arguments stay whole.
+    
+    Cached because the same command is run for every mutant.
+    """
+    if os.name == 'posix':
+        return tuple(shlex.split(test_command))
+    # list2cmdline quoting: drop the double quotes around arguments with spaces
+    return tuple(
+        arg[1:-1] if len(arg) > 1 and arg[0] == arg[-1] == '"' else arg
+        for arg in shlex.split(test_command, posix=False)
+    )
+
+
+def format_test_command(args: Sequence[str]) -> str:
+    """
+    Join arguments into a test command that _split_test_command splits back into args.
+    
+    Arguments are quoted as needed, so paths with spaces or quotes survive.
+    """
+    if os.name == 'posix':
+        return shlex.join(args)
+    return subprocess.list2cmdline(args)
+
+
+def _output_tail(text: str, limit: int = MAX_CAPTURED_OUTPUT_CHARS) -> str:
+    """Last limit characters of captured test output, marked when truncated."""
+    if len(text) <= limit:
+        return text
+    return f"...[truncated {len(text) - limit} chars]\n{text[-limit:]}"
+
+
+def _precedence(node: ast.AST) -> int:
+    """How tightly the unparsed text of an expression binds; higher binds tighter, atoms are 15."""
+    if isinstance(node, (ast.Lambda, ast.NamedExpr)):
+        return 0
+    if isinstance(node, ast.IfExp):
+        return 1
+    if isinstance(node, ast.BoolOp):
+        return 2 if isinstance(node.op, ast.Or) else 3
+    if isinstance(node, ast.UnaryOp):
+        return 4 if isinstance(node.op, ast.Not) else 12
+    if isinstance(node, ast.Compare):
+        return 5
+    if isinstance(node, ast.BinOp):
+        return _BINOP_PRECEDENCE.get(type(node.op), 0)
+    if isinstance(node, ast.Constant):
+        # Negative numbers unparse with a unary minus
+        value = node.value
+        if isinstance(value, float) and math.copysign(1.0, value) < 0:
+            return 12
+        if isinstance(value, int) and not isinstance(value, bool) and value < 0:
+            return 12
+    return 15
+
 
 class MutationOperator:
     """Base class for mutation operators."""
     
+    # AST node classes this operator may mutate; the engine dispatches on type(node)
+    NODE_TYPES: Tuple[type, ...] = ()
+    
     def can_mutate(self, node: ast.AST) -> bool:
         """Check if this operator can mutate the given AST node."""
         raise NotImplementedError
@@ -28,6 +126,8 @@ class MutationOperator:
 class BinaryOperatorMutator(MutationOperator):
     """Mutates binary operators like +, -, *, /, ==, !=, <, >, etc."""
     
+    NODE_TYPES = (ast.BinOp, ast.Compare, ast.BoolOp)
+    
     MUTATIONS = {
         ast.Add: [ast.Sub, ast.Mult],
         ast.Sub: [ast.Add, ast.Div],
@@ -44,9 +144,10 @@ class BinaryOperatorMutator(MutationOperator):
     }
     
     def can_mutate(self, node: ast.AST) -> bool:
-        return isinstance(node, (ast.BinOp, ast.Compare, ast.BoolOp)) and \
-               type(node.op if hasattr(node, 'op') else 
-                   node.ops[0] if hasattr(node, 'ops') and node.ops else None) in self.MUTATIONS
+        node_type = type(node)
+        if node_type is ast.Compare:
+            return bool(node.ops) and type(node.ops[0]) in self.MUTATIONS
+        return node_type in (ast.BinOp, ast.BoolOp) and type(node.op) in self.MUTATIONS
     
     def mutate(self, node: ast.AST) -> List[ast.AST]:
         mutations: List[ast.AST] = []
@@ -66,7 +167,7 @@ class BinaryOperatorMutator(MutationOperator):
             if op_type in self.MUTATIONS:
                 for new_op_type in self.MUTATIONS[op_type]:
                     mutated = ast.copy_location(
-                        ast.Compare(left=node.left, ops=[new_op_type()], comparators=node.comparators),
+                        ast.Compare(left=node.left, ops=[new_op_type(), *node.ops[1:]], comparators=node.comparators),
                         node
                     )
                     mutations.append(mutated)
@@ -83,14 +184,15 @@ class BinaryOperatorMutator(MutationOperator):
         
         return mutations
     
+    OP_SYMBOLS = {
+        ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.Div: '/',
+        ast.Eq: '==', ast.NotEq: '!=', ast.Lt: '<', ast.LtE: '<=',
+        ast.Gt: '>', ast.GtE: '>=', ast.And: 'and', ast.Or: 'or'
+    }
+    
     def describe_mutation(self, original: ast.AST, mutated: ast.AST) -> Tuple[str, str]:
         def get_op_symbol(op):
-            op_symbols = {
-                ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.Div: '/',
-                ast.Eq: '==', ast.NotEq: '!=', ast.Lt: '<', ast.LtE: '<=',
-                ast.Gt: '>', ast.GtE: '>=', ast.And: 'and', ast.Or: 'or'
-            }
-            return op_symbols.get(type(op), str(type(op).__name__))
+            return self.OP_SYMBOLS.get(type(op)) or type(op).__name__
         
         if isinstance(original, ast.BinOp):
             orig_op = get_op_symbol(original.op)
@@ -111,68 +213,65 @@ class BinaryOperatorMutator(MutationOperator):
 class ConstantMutator(MutationOperator):
     """Mutates constants like numbers, booleans, and strings."""
     
+    NODE_TYPES = (ast.Constant,)
+    # Longest string that is also mutated by dropping its last character
+    MAX_TRUNCATED_STRING_LENGTH = 256
+    
     def can_mutate(self, node: ast.AST) -> bool:
-        return isinstance(node, (ast.Constant, ast.Num, ast.Str, ast.NameConstant))
+        # Since Python 3.8 every literal parses to ast.Constant; the ast.Num/Str/
+        # NameConstant aliases warn on each access and are gone in 3.14
+        if type(node) is not ast.Constant:
+            return False
+        value = node.value
+        return isinstance(value, (int, float)) or (isinstance(value, str) and value != "")
+    
+    def __init__(self):
+        # Replacement values keyed by (type, value); the same literals recur throughout a module
+        self._replacements: Dict[Tuple[type, Any], Tuple[Any, ...]] = {}
+    
+    def _replacement_values(self, value: Any) -> Tuple[Any, ...]:
+        """Return the distinct values a constant is mutated to, computed once per literal."""
+        key = (type(value), value)
+        replacements = self._replacements.get(key)
+        if replacements is None:
+            # Generate mutations based on value type
+            if isinstance(value, bool):
+                candidates = (not value,)
+            elif isinstance(value, int):
+                candidates = (value + 1, value - 1, 0, 1, -1)
+            elif isinstance(value, float):
+                candidates = (value + 1.0, value - 1.0, 0.0, 1.0)
+            elif isinstance(value, str) and value:
+                # String mutations; long literals (SQL, embedded data) only get emptied
+                # rather than copied nearly whole
+                if 1 < len(value) <= self.MAX_TRUNCATED_STRING_LENGTH:
+                    candidates = ("", value[:-1])
+                else:
+                    candidates = ("",)
+            else:
+                candidates = ()
+            # Candidates can coincide (2 - 1 and the literal 1); each would be a duplicate mutant
+            replacements = tuple(new_val for new_val in dict.fromkeys(candidates) if new_val != value)
+            self._replacements[key] = replacements
+        return replacements
     
     def mutate(self, node: ast.AST) -> List[ast.AST]:
-        mutations: List[ast.AST] = []
-        
-        # Get the value based on node type (compatibility with different Python versions)
-        if isinstance(node, ast.Constant):
-            value = node.value
-        elif isinstance(node, ast.Num):
-            value = node.n
-        elif isinstance(node, ast.Str):
-            value = node.s
-        elif isinstance(node, ast.NameConstant):
-            value = node.value
-        else:
-            return mutations
-        
-        # Generate mutations based on value type
-        if isinstance(value, bool):
-            mutated = ast.copy_location(ast.Constant(value=not value), node)
-            mutations.append(mutated)
-        elif isinstance(value, int):
-            for new_val in [value + 1, value - 1, 0, 1, -1]:
-                if new_val != value:
-                    mutated = ast.copy_location(ast.Constant(value=new_val), node)
-                    mutations.append(mutated)
-        elif isinstance(value, float):
-            for new_val in [value + 1.0, value - 1.0, 0.0, 1.0]:
-                if new_val != value:
-                    mutated = ast.copy_location(ast.Constant(value=new_val), node)
-                    mutations.append(mutated)
-        elif isinstance(value, str) and value:
-            # String mutations
-            mutated = ast.copy_location(ast.Constant(value=""), node)
-            mutations.append(mutated)
-            if len(value) > 1:
-                mutated = ast.copy_location(ast.Constant(value=value[:-1]), node)
-                mutations.append(mutated)
-        
-        return mutations
+        if not isinstance(node, ast.Constant):
+            return []
+        return [
+            ast.copy_location(ast.Constant(value=new_val), node)
+            for new_val in self._replacement_values(node.value)
+        ]
     
     def describe_mutation(self, original: ast.AST, mutated: ast.AST) -> Tuple[str, str]:
-        def get_value(node):
-            if isinstance(node, ast.Constant):
-                return repr(node.value)
-            elif isinstance(node, ast.Num):
-                return str(node.n)
-            elif isinstance(node, ast.Str):
-                return repr(node.s)
-            elif isinstance(node, ast.NameConstant):
-                return str(node.value)
-            return "unknown"
-        
-        orig_val = get_value(original)
-        mut_val = get_value(mutated)
-        return f"constant {orig_val}", f"constant {mut_val}"
+        return f"constant {original.value!r}", f"constant {mutated.value!r}"
 
 
 class ConditionalMutator(MutationOperator):
     """Mutates conditional expressions and statements."""
     
+    NODE_TYPES = (ast.If, ast.While, ast.IfExp)
+    
     def can_mutate(self, node: ast.AST) -> bool:
         return isinstance(node, (ast.If, ast.While, ast.IfExp))
     
@@ -237,117 +336,249 @@ class MutationEngine:
     
     def __init__(self, target_file: str):
         self.target_file = Path(target_file).resolve()
+        # Contents of target_file before any mutant was written, read on first use
+        self._original_content: Optional[bytes] = None
+        # Auto-detected test command, looked up once on first use
+        self._detected_test_command: Optional[str] = None
+        self._test_command_detected = False
+        # Seconds a test run may take before it is killed and counted as timed out
+        self.test_timeout = DEFAULT_TEST_TIMEOUT_SECONDS
         self.operators = [
             BinaryOperatorMutator(),
             ConstantMutator(),
             ConditionalMutator()
         ]
+        # Operators by the node type they apply to, in self.operators order
+        self._operators_by_type: Dict[type, List[MutationOperator]] = {}
+        for operator in self.operators:
+            for node_type in operator.NODE_TYPES:
+                self._operators_by_type.setdefault(node_type, []).append(operator)
     
-    def generate_mutations(self, source_code: str) -> List[Dict]:
-        """Generate all possible mutations for the source code."""
+    def generate_mutations(self, source_code: str, tree: Optional[ast.Module] = None) -> List[Dict]:
+        """
+        Generate all possible mutations for the source code.
+        
+        tree is the parsed source_code, e.g. as cached by load_python_file; it
+        is parsed here if omitted. The tree is only read, never modified.
+        """
         try:
-            tree = ast.parse(source_code)
-            mutations: List[Dict] = []
-            
-            for node in ast.walk(tree):
-                for operator in self.operators:
-                    if operator.can_mutate(node):
-                        mutated_nodes = operator.mutate(node)
-                        for mutated_node in mutated_nodes:
-                            # Create a copy of the tree with the mutation
-                            mutated_tree = self._apply_mutation(tree, node, mutated_node)
-                            if mutated_tree:
-                                mutated_code = ast.unparse(mutated_tree)
-                                original_desc, mutated_desc = operator.describe_mutation(node, mutated_node)
-                                
-                                mutations.append({
-                                    "id": f"mutation_{len(mutations) + 1}",
-                                    "original": original_desc,
-                                    "mutated": mutated_desc,
-                                    "original_code": source_code,
-                                    "mutated_code": mutated_code,
-                                    "line_number": getattr(node, 'lineno', 0),
-                                    "operator": operator.__class__.__name__
-                                })
-            
-            return mutations
-            
+            return list(self.iter_mutations(source_code, tree))
         except Exception as e:
-            print(f"Error generating mutations: {e}")
+            logger.error("Error generating mutations: %s", e)
             return []
     
-    def _apply_mutation(self, tree: ast.AST, target_node: ast.AST, replacement: ast.AST) -> Optional[ast.AST]:
-        """Apply a single mutation to the AST tree."""
+    def iter_mutations(self, source_code: str, tree: Optional[ast.Module] = None) -> Iterator[Dict]:
+        """
+        Yield the mutations of generate_mutations one at a time, in the same order.
+        
+        Callers that test only some mutants can stop early or just count the
+        rest without holding every mutated copy of the source. Errors are
+        raised rather than logged.
+        """
+        if tree is None:
+            tree = ast.parse(source_code)
+        count = 0
+        # Mutants are the original source with one node's text replaced, so
+        # formatting and comments elsewhere are kept and nothing else is unparsed
+        source_lines = split_source_lines(source_code)
+        line_starts = list(itertools.accumulate(map(len, source_lines), initial=0))
+        # Different operators can yield the same source (negating `if True` and
+        # mutating the True itself), and some yield the original unchanged; each
+        # would only repeat a test run, so only the first distinct mutant is kept.
+        # Digests are remembered rather than the sources themselves.
+        seen_digests = {self._source_digest(source_code)}
+        
+        for node, location, operators in self._collect_mutation_sites(tree):
+            line_number = getattr(node, 'lineno', 0)
+            for operator in operators:
+                if operator.can_mutate(node):
+                    operator_name = operator.__class__.__name__
+                    mutated_nodes = operator.mutate(node)
+                    for mutated_node in mutated_nodes:
+                        mutated_code = self._splice_mutation(
+                            source_code, source_lines, line_starts, node, location, mutated_node
+                        )
+                        if mutated_code is None:
+                            continue
+                        digest = self._source_digest(mutated_code)
+                        if digest in seen_digests:
+                            continue
+                        seen_digests.add(digest)
+                        original_desc, mutated_desc = operator.describe_mutation(node, mutated_node)
+                        
+                        count += 1
+                        yield {
+                            "id": f"mutation_{count}",
+                            "original": original_desc,
+                            "mutated": mutated_desc,
+                            "original_code": source_code,
+                            "mutated_code": mutated_code,
+                            "line_number": line_number,
+                            "operator": operator_name
+                        }
+    
+    @staticmethod
+    def _source_digest(source_code: str) -> bytes:
+        """A 16-byte digest identifying source_code, for spotting repeated mutants."""
+        return hashlib.blake2b(source_code.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    
+    def _collect_mutation_sites(self, tree: ast.Module) -> List[Tuple[ast.AST, Tuple[ast.AST, str, Optional[int], Optional[ast.JoinedStr]], List[MutationOperator]]]:
+        """
+        Walk the module once, breadth-first like ast.walk, dispatching on node type.
+        
+        Returns (node, location, operators) for every node that has operators
+        registered for its type. location is (parent, field, index, fstring):
+        index is the position within a list field, or None for single-node
+        fields, and fstring is the outermost f-string containing the node, if any.
+        """
+        operators_by_type = self._operators_by_type
+        sites = []
+        queue = collections.deque((node, (tree, 'body', index, None)) for index, node in enumerate(tree.body))
+        while queue:
+            node, location = queue.popleft()
+            if type(node) is ast.Expr and type(node.value) is ast.Constant and isinstance(node.value.value, str):
+                # A bare string statement (docstrings included) does nothing, so
+                # every mutant of it would be equivalent and always survive
+                continue
+            operators = operators_by_type.get(type(node))
+            if operators:
+                sites.append((node, location, operators))
+            fstring = location[3]
+            if fstring is None and type(node) is ast.JoinedStr:
+                fstring = node
+            for field, value in ast.iter_fields(node):
+                if isinstance(value, ast.AST):
+                    if type(value) not in _LEAF_NODE_TYPES:
+                        queue.append((value, (node, field, None, fstring)))
+                elif isinstance(value, list):
+                    for index, item in enumerate(value):
+                        if isinstance(item, ast.AST) and type(item) not in _LEAF_NODE_TYPES:
+                            queue.append((item, (node, field, index, fstring)))
+        return sites
+    
+    @staticmethod
+    def _source_offset(source_lines: List[str], line_starts: List[int], lineno: int, col_offset: int) -> int:
+        """Convert an AST position (1-based line, UTF-8 byte column) to an index into the source string."""
+        line = source_lines[lineno - 1]
+        if not line.isascii():
+            col_offset = len(line.encode()[:col_offset].decode())
+        return line_starts[lineno - 1] + col_offset
+    
+    def _splice_mutation(self, source_code: str, source_lines: List[str], line_starts: List[int], node: ast.AST,
+                         location: Tuple[ast.AST, str, Optional[int], Optional[ast.JoinedStr]],
+                         replacement: ast.AST) -> Optional[str]:
+        """
+        Return source_code with the text of node replaced by the unparsed replacement.
+        
+        Expressions are parenthesized when the replacement binds less tightly
+        than the original, so it still parses as one operand in its context.
+        """
         try:
-            # Create a deep copy of the tree
-            mutated_tree = ast.parse(ast.unparse(tree))
-            
-            # Find and replace the target node in the mutated tree
-            for node in ast.walk(mutated_tree):
-                if self._nodes_equivalent(node, target_node):
-                    # Replace the node's attributes with the replacement
-                    for attr in node._fields:
-                        if hasattr(replacement, attr):
-                            setattr(node, attr, getattr(replacement, attr))
-                    break
-            
-            return mutated_tree
+            fstring = location[3]
+            if fstring is not None:
+                # Literal parts of an f-string have no source text of their own; render the whole f-string
+                target = fstring
+                fragment = self._unparse_fstring_with_replacement(fstring, location, replacement)
+            elif isinstance(node, ast.stmt):
+                # Statement mutations change the header expression (an if/while test);
+                # splice just that so the body keeps its formatting
+                changed = [field for field in node._fields if getattr(replacement, field, None) is not getattr(node, field, None)]
+                target = getattr(node, changed[0]) if len(changed) == 1 else None
+                if isinstance(target, ast.expr):
+                    fragment = ast.unparse(getattr(replacement, changed[0]))
+                else:
+                    target = node
+                    indent = source_lines[node.lineno - 1][:node.col_offset]
+                    fragment = ast.unparse(replacement).replace("\n", "\n" + indent)
+            else:
+                target = node
+                fragment = ast.unparse(replacement)
+                if _precedence(replacement) < _precedence(node):
+                    fragment = f"({fragment})"
             
+            start = self._source_offset(source_lines, line_starts, target.lineno, target.col_offset)
+            end = self._source_offset(source_lines, line_starts, target.end_lineno, target.end_col_offset)
+            return source_code[:start] + fragment + source_code[end:]
         except Exception as e:
-            print(f"Error applying mutation: {e}")
+            logger.error("Error applying mutation: %s", e)
             return None
     
-    def _nodes_equivalent(self, node1: ast.AST, node2: ast.AST) -> bool:
-        """Check if two AST nodes are equivalent for mutation purposes."""
-        if type(node1) != type(node2):
-            return False
-        
-        # Compare line numbers if available
-        if hasattr(node1, 'lineno') and hasattr(node2, 'lineno'):
-            return node1.lineno == node2.lineno
+    @staticmethod
+    def _unparse_fstring_with_replacement(fstring: ast.JoinedStr, location: Tuple[ast.AST, str, Optional[int], Optional[ast.JoinedStr]],
+                                          replacement: ast.AST) -> str:
+        """
+        Unparse fstring with the node at location swapped for replacement.
         
-        # For nodes without line numbers, compare structure
-        return ast.dump(node1) == ast.dump(node2)
+        The swap is made in a copy of the f-string, which is small, so the
+        (possibly shared) tree is never modified.
+        """
+        parent, field, index, _ = location
+        memo = {}
+        fstring_copy = copy.deepcopy(fstring, memo)
+        parent_copy = memo[id(parent)]
+        if index is None:
+            setattr(parent_copy, field, replacement)
+        else:
+            getattr(parent_copy, field)[index] = replacement
+        return ast.unparse(fstring_copy)
     
     def run_tests_against_mutation(self, mutated_code: str, test_command: Optional[str] = None) -> Dict:
         """Run tests against a mutated version of the code."""
+        return self._run_tests(test_command, mutated_code)
+    
+    def run_baseline_tests(self, test_command: Optional[str] = None) -> Dict:
+        """
+        Run the tests against the unmodified target.
+        
+        The result is shaped like run_tests_against_mutation's, plus the run's
+        wall-clock "execution_time" in seconds.
+        """
+        started = time.perf_counter()
+        result = self._run_tests(test_command)
+        result["execution_time"] = time.perf_counter() - started
+        return result
+    
+    def _run_tests(self, test_command: Optional[str], mutated_code: Optional[str] = None) -> Dict:
+        """Run the test command with mutated_code written over the target (the original if None)."""
         original_content = None
         try:
-            # Backup original file
-            original_content = self.target_file.read_text()
+            # Backup original file once per engine, as bytes so the restore is exact
+            if self._original_content is None:
+                self._original_content = self.target_file.read_bytes()
             
-            # Write mutated code
-            self.target_file.write_text(mutated_code)
-            
-            # Run tests
             if not test_command:
-                # Try to find test files automatically
-                test_command = self._find_test_command()
+                # Try to find test files automatically (once per engine, while
+                # the target still holds its original contents)
+                if not self._test_command_detected:
+                    self._detected_test_command = self._find_test_command()
+                    self._test_command_detected = True
+                test_command = self._detected_test_command
             
-            if test_command:
-                result = subprocess.run(
-                    test_command.split(),
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    cwd=self.target_file.parent
-                )
-                
-                return {
-                    "passed": result.returncode == 0,
-                    "stdout": result.stdout,
-                    "stderr": result.stderr,
-                    "return_code": result.returncode
-                }
-            else:
+            if not test_command:
                 return {
                     "passed": None,
                     "error": "No test command found"
                 }
+            
+            # Write mutated code
+            if mutated_code is not None:
+                original_content = self._original_content
+                self.target_file.write_text(mutated_code)
+            
+            # Run tests
+            return_code, stdout, stderr = self._run_test_process(_split_test_command(test_command))
+            
+            return {
+                "passed": return_code == 0,
+                "stdout": stdout,
+                "stderr": stderr,
+                "return_code": return_code
+            }
                 
         except subprocess.TimeoutExpired:
             return {
                 "passed": False,
+                "timed_out": True,
                 "error": "Test execution timed out"
             }
         except Exception as e:
@@ -358,7 +589,51 @@ class MutationEngine:
         finally:
             # Restore original file
             if original_content is not None:
-                self.target_file.write_text(original_content)
+                self.target_file.write_bytes(original_content)
+    
+    def _run_test_process(self, args: Sequence[str]) -> Tuple[int, str, str]:
+        """
+        Run a test command in the target's directory and return (return code, stdout, stderr).
+        
+        Each captured stream is cut to its last MAX_CAPTURED_OUTPUT_CHARS, since
+        the output is kept with every mutant's result for the whole run.
+        
+        The command gets its own process group (session on POSIX) so that on
+        timeout the whole group is killed, including workers the test runner
+        spawned, before subprocess.TimeoutExpired is re-raised. The limit is
+        self.test_timeout.
+        
+        Bytecode writing is disabled: .pyc files are validated by source mtime
+        (whole seconds) and size, so a mutant's cached bytecode could be loaded
+        for a later same-size mutant or for the restored original.
+        """
+        if os.name == 'posix':
+            group_kwargs = {"start_new_session": True}
+        else:
+            group_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        proc = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=self.target_file.parent,
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+            **group_kwargs
+        )
+        try:
+            stdout, stderr = proc.communicate(timeout=self.test_timeout)
+        except BaseException:
+            if os.name == 'posix':
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            else:
+                proc.kill()
+            # Reap the child and close the pipes
+            proc.communicate()
+            raise
+        return proc.returncode, _output_tail(stdout), _output_tail(stderr)
     
     def _find_test_command(self) -> Optional[str]:
         """Automatically find an appropriate test command."""
@@ -372,13 +647,13 @@ class MutationEngine:
                 test_files.append(str(test_file))
         
         if test_files:
-            return f"python -m pytest {test_files[0]} -v"
+            return format_test_command(["python", "-m", "pytest", test_files[0], "-v"])
         
         # Try running the file directly if it has a main block
         try:
             content = self.target_file.read_text()
             if 'if __name__ == "__main__"' in content:
-                return f"python {self.target_file}"
+                return format_test_command(["python", str(self.target_file)])
         except:
             pass
         
@@ -1,17 +1,48 @@
+import logging
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from typing import Dict, List, Optional, Tuple
-from baml_client.sync_client import b
-from baml_client.types import MutationAnalysis
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from baml_client.types import MutationAnalysis
+
+logger = logging.getLogger(__name__)
+
+# BAML sync client, imported on first analysis by _get_baml
+_baml = None
+
+_SUMMARY_TEMPLATE = """Mutation {index}:
+- Line {line}: {original} → {mutated}
+- Operator: {operator}
+"""
+
+_DETAILS_TEMPLATE = """Mutation {index} Details:
+- ID: {id}
+- Line: {line_detail}
+- Operator: {operator}
+- Original: {original}
+- Mutated: {mutated}
+- Status: Survived (test did not detect this change)
+
+"""
+
+
+def _get_baml():
+    """Return the BAML client, importing baml_client only when an analysis is first requested."""
+    global _baml
+    if _baml is None:
+        from baml_client.sync_client import b
+        _baml = b
+    return _baml
 
 
 class MutationIntelligence:
     """AI-powered analysis of mutation testing results using BAML."""
     
     def __init__(self):
-        pass  # BAML client is imported as 'b'
+        pass  # BAML client is imported lazily by _get_baml
     
     def analyze_survived_mutations(self, mutations: List[Dict], source_code: str) -> Dict:
         """
@@ -34,11 +65,10 @@ class MutationIntelligence:
         
         try:
             # Format survived mutations for BAML
-            survived_mutations_text = self._format_mutations_for_baml(mutations)
-            mutation_details = self._format_mutation_details(mutations)
+            survived_mutations_text, mutation_details = self._format_mutations_for_baml(mutations)
             
             # Call BAML function for analysis
-            analysis: MutationAnalysis = b.AnalyzeMutationResults(
+            analysis: MutationAnalysis = _get_baml().AnalyzeMutationResults(
                 source_code=source_code,
                 survived_mutations=survived_mutations_text,
                 mutation_details=mutation_details
@@ -60,30 +90,23 @@ class MutationIntelligence:
                 "overall_assessment": f"Analysis failed due to error: {str(e)}"
             }
     
-    def _format_mutations_for_baml(self, mutations: List[Dict]) -> str:
-        """Format mutations for BAML input."""
-        mutations_text = ""
+    def _format_mutations_for_baml(self, mutations: List[Dict]) -> Tuple[str, str]:
+        """Format mutations for BAML input as (summary, details), reading each mutation once."""
+        summaries = []
+        details = []
         for i, mutation in enumerate(mutations, 1):
-            mutations_text += f"""Mutation {i}:
-- Line {mutation.get('line_number', '?')}: {mutation.get('original', 'Unknown')} → {mutation.get('mutated', 'Unknown')}
-- Operator: {mutation.get('operator', 'Unknown')}
-"""
-        return mutations_text.strip()
-    
-    def _format_mutation_details(self, mutations: List[Dict]) -> str:
-        """Format detailed mutation information for BAML."""
-        details_text = ""
-        for i, mutation in enumerate(mutations, 1):
-            details_text += f"""Mutation {i} Details:
-- ID: {mutation.get('id', f'mutation_{i}')}
-- Line: {mutation.get('line_number', 'Unknown')}
-- Operator: {mutation.get('operator', 'Unknown')}
-- Original: {mutation.get('original', 'Unknown')}
-- Mutated: {mutation.get('mutated', 'Unknown')}
-- Status: Survived (test did not detect this change)
-
-"""
-        return details_text.strip()
+            fields = {
+                "index": i,
+                "id": mutation.get('id', f'mutation_{i}'),
+                "line": mutation.get('line_number', '?'),
+                "line_detail": mutation.get('line_number', 'Unknown'),
+                "original": mutation.get('original', 'Unknown'),
+                "mutated": mutation.get('mutated', 'Unknown'),
+                "operator": mutation.get('operator', 'Unknown'),
+            }
+            summaries.append(_SUMMARY_TEMPLATE.format_map(fields))
+            details.append(_DETAILS_TEMPLATE.format_map(fields))
+        return "".join(summaries).strip(), "".join(details).strip()
     
     def generate_test_suggestions(self, mutation: Dict, source_code: str) -> List[str]:
         """
@@ -106,7 +129,7 @@ class MutationIntelligence:
 - Line: {mutation.get('line_number', 'Unknown')}"""
 
             # Use BAML for analysis of single mutation
-            analysis: MutationAnalysis = b.AnalyzeMutationResults(
+            analysis: MutationAnalysis = _get_baml().AnalyzeMutationResults(
                 source_code=source_code,
                 survived_mutations=mutation_text,
                 mutation_details=mutation_details
@@ -145,7 +168,7 @@ class MutationIntelligence:
             return sorted(mutations, key=lambda m: m.get("priority_score", 0), reverse=True)
             
         except Exception as e:
-            print(f"Warning: Failed to prioritize mutations: {e}")
+            logger.warning("Failed to prioritize mutations: %s", e)
             return mutations
     
     def _calculate_priority_score(self, mutation: Dict, source_code: str) -> int:
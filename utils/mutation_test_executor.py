@@ -1,3 +1,5 @@
+import itertools
+import logging
 import sys
 import os
 from typing import Dict, List, Optional, Tuple
@@ -7,9 +9,16 @@ import time
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from utils.mutation_engine import MutationEngine
-from utils.file_handlers import read_python_file
+from utils.file_handlers import load_python_file
 from utils.mutation_intelligence import MutationIntelligence
 
+logger = logging.getLogger(__name__)
+
+# A mutant's test run may take this multiple of the unmodified run's time
+# (but at least MIN_MUTANT_TIMEOUT_SECONDS) before it is killed
+MUTANT_TIMEOUT_FACTOR = 5
+MIN_MUTANT_TIMEOUT_SECONDS = 2.0
+
 
 class MutationTestExecutor:
     """Executes mutation testing using custom mutation engine and AI analysis."""
@@ -31,66 +40,82 @@ class MutationTestExecutor:
             Dictionary with comprehensive mutation testing results
         """
         try:
-            # Read source code
-            source_code = read_python_file(str(self.target_file))
+            # Read and parse source code (cached while the file is unchanged)
+            source_code, tree = load_python_file(str(self.target_file))
             if not source_code:
                 return self._error_result("Could not read source file")
             
-            print(f"Generating mutations for {self.target_file.name}...")
+            logger.info("Generating mutations for %s...", self.target_file.name)
             
-            # Generate all possible mutations
-            all_mutations = self.engine.generate_mutations(source_code)
-            if not all_mutations:
+            # Generate mutations, keeping only those to be tested (limited for
+            # performance); the rest are counted without holding their sources
+            mutation_iter = self.engine.iter_mutations(source_code, tree)
+            mutations_to_test = list(itertools.islice(mutation_iter, max_mutations))
+            if not mutations_to_test:
                 return self._error_result("No mutations could be generated")
+            total_possible_mutations = len(mutations_to_test) + sum(1 for _ in mutation_iter)
             
-            # Limit mutations for performance
-            mutations_to_test = all_mutations[:max_mutations]
-            print(f"Testing {len(mutations_to_test)} mutations (out of {len(all_mutations)} possible)...")
+            # Time the tests on the unmodified code to scale the per-mutant
+            # timeout; if they already fail, every mutant would look killed
+            baseline = self.engine.run_baseline_tests(test_command)
+            if baseline.get("passed") is False:
+                reason = baseline.get("error") or f"exit code {baseline.get('return_code')}"
+                return self._error_result(f"Tests fail on the unmodified code ({reason}); fix them before mutation testing")
+            if baseline.get("passed"):
+                self.engine.test_timeout = max(MIN_MUTANT_TIMEOUT_SECONDS, MUTANT_TIMEOUT_FACTOR * baseline["execution_time"])
+            
+            logger.info("Testing %d mutations (out of %d possible)...", len(mutations_to_test), total_possible_mutations)
             
             # Test each mutation
             results = []
             survived_mutations = []
             killed_count = 0
+            timeout_count = 0
             
             for i, mutation in enumerate(mutations_to_test, 1):
-                print(f"Testing mutation {i}/{len(mutations_to_test)}: {mutation['original']} → {mutation['mutated']}")
+                logger.debug("Testing mutation %d/%d: %s → %s", i, len(mutations_to_test), mutation['original'], mutation['mutated'])
                 
                 # Run tests against this mutation
+                started = time.perf_counter()
                 test_result = self.engine.run_tests_against_mutation(
                     mutation['mutated_code'], 
                     test_command
                 )
+                execution_time = time.perf_counter() - started
                 
+                status = "killed" if test_result.get("passed") == False else "survived"
                 mutation_result = {
                     **mutation,
                     "test_result": test_result,
-                    "status": "killed" if test_result.get("passed") == False else "survived",
-                    "execution_time": time.time()  # Placeholder for timing
+                    "status": status,
+                    "execution_time": execution_time
                 }
                 
                 results.append(mutation_result)
                 
-                if test_result.get("passed") == False:
+                if status == "killed":
                     killed_count += 1
+                    if test_result.get("timed_out"):
+                        timeout_count += 1
                 else:
                     survived_mutations.append(mutation_result)
             
             # Calculate mutation score
             mutation_score = (killed_count / len(mutations_to_test)) * 100 if mutations_to_test else 0
             
-            print(f"Mutation testing complete. Score: {mutation_score:.1f}% ({killed_count}/{len(mutations_to_test)})")
+            logger.info("Mutation testing complete. Score: %.1f%% (%d/%d)", mutation_score, killed_count, len(mutations_to_test))
             
             # Generate AI analysis for survived mutations
             ai_analysis = {}
             if survived_mutations:
-                print("Analyzing survived mutations with AI...")
+                logger.info("Analyzing survived mutations with AI...")
                 ai_analysis = self._analyze_survivors(survived_mutations, source_code)
             
             return {
                 "status": "completed",
                 "target_file": str(self.target_file),
                 "source_code": source_code,
-                "total_possible_mutations": len(all_mutations),
+                "total_possible_mutations": total_possible_mutations,
                 "mutations_tested": len(mutations_to_test),
                 "mutations_killed": killed_count,
                 "mutations_survived": len(survived_mutations),
@@ -102,7 +127,7 @@ class MutationTestExecutor:
                     "total": len(mutations_to_test),
                     "killed": killed_count,
                     "survived": len(survived_mutations),
-                    "timeout": 0  # Our engine doesn't use timeouts for individual mutations
+                    "timeout": timeout_count
                 }
             }
             
@@ -112,11 +137,11 @@ class MutationTestExecutor:
     def run_mutation_generation_only(self) -> Dict:
         """Generate mutations without running tests - useful for analysis."""
         try:
-            source_code = read_python_file(str(self.target_file))
+            source_code, tree = load_python_file(str(self.target_file))
             if not source_code:
                 return self._error_result("Could not read source file")
             
-            mutations = self.engine.generate_mutations(source_code)
+            mutations = self.engine.generate_mutations(source_code, tree)
             
             return {
                 "status": "completed",
@@ -153,7 +178,7 @@ class MutationTestExecutor:
             return analysis
             
         except Exception as e:
-            print(f"Warning: AI analysis failed: {e}")
+            logger.warning("AI analysis failed: %s", e)
             return {"error": str(e)}
     
     def _error_result(self, error_message: str) -> Dict:
@@ -182,7 +207,7 @@ class MutationTestExecutor:
         ai_analysis = results.get("ai_analysis", {})
         
         # Generate report
-        report = f"""# Mutation Testing Report
+        parts = [f"""# Mutation Testing Report
 
 **File:** `{results.get('target_file', 'Unknown')}`  
 **Mutation Score:** {mutation_score:.1f}% ({mutations_killed}/{mutations_tested} mutations killed)
@@ -194,21 +219,21 @@ class MutationTestExecutor:
 - **Mutations Survived:** {mutations_survived} ⚠️
 
 ## Quality Assessment
-"""
+"""]
         
         if mutation_score >= 80:
-            report += "🎉 **Excellent** - Your test suite catches most mutations! This indicates strong test coverage.\n"
+            parts.append("🎉 **Excellent** - Your test suite catches most mutations! This indicates strong test coverage.\n")
         elif mutation_score >= 60:
-            report += "✅ **Good** - Your test suite is solid but has some gaps to address.\n"
+            parts.append("✅ **Good** - Your test suite is solid but has some gaps to address.\n")
         elif mutation_score >= 40:
-            report += "⚠️ **Needs Improvement** - Your test suite has significant gaps that could hide bugs.\n"
+            parts.append("⚠️ **Needs Improvement** - Your test suite has significant gaps that could hide bugs.\n")
         else:
-            report += "❌ **Poor** - Your test suite needs major improvements to catch potential bugs.\n"
+            parts.append("❌ **Poor** - Your test suite needs major improvements to catch potential bugs.\n")
         
         # Add survived mutations details
         if survived_mutations:
-            report += f"\n## Survived Mutations ({len(survived_mutations)})\n"
-            report += "These mutations were **not caught** by your tests, indicating potential test gaps:\n\n"
+            parts.append(f"\n## Survived Mutations ({len(survived_mutations)})\n")
+            parts.append("These mutations were **not caught** by your tests, indicating potential test gaps:\n\n")
             
             # Sort by priority if available
             sorted_mutations = survived_mutations
@@ -216,69 +241,72 @@ class MutationTestExecutor:
                 sorted_mutations = ai_analysis["prioritized_mutations"][:10]  # Top 10
             
             for i, mutation in enumerate(sorted_mutations, 1):
-                report += f"### {i}. {mutation.get('original', 'Unknown')}\n"
-                report += f"- **Changed to:** {mutation.get('mutated', 'Unknown')}\n"
-                report += f"- **Line:** {mutation.get('line_number', 'Unknown')}\n"
-                report += f"- **Operator:** {mutation.get('operator', 'Unknown')}\n"
+                parts.append(f"### {i}. {mutation.get('original', 'Unknown')}\n")
+                parts.append(f"- **Changed to:** {mutation.get('mutated', 'Unknown')}\n")
+                parts.append(f"- **Line:** {mutation.get('line_number', 'Unknown')}\n")
+                parts.append(f"- **Operator:** {mutation.get('operator', 'Unknown')}\n")
                 
                 # Add test failure details if available
                 test_result = mutation.get('test_result', {})
                 if test_result.get('error'):
-                    report += f"- **Test Error:** {test_result['error']}\n"
+                    parts.append(f"- **Test Error:** {test_result['error']}\n")
                 elif test_result.get('passed') is None:
-                    report += f"- **Issue:** No tests were found or executed\n"
+                    parts.append(f"- **Issue:** No tests were found or executed\n")
                 elif test_result.get('passed') is True:
-                    report += f"- **Issue:** Tests passed even with this mutation\n"
+                    parts.append(f"- **Issue:** Tests passed even with this mutation\n")
                 
-                report += "\n"
+                parts.append("\n")
         
         # Add AI analysis
         if ai_analysis and not ai_analysis.get("error"):
-            report += "\n## 🤖 AI Analysis\n"
+            parts.append("\n## 🤖 AI Analysis\n")
             
             # Critical survivors
             critical = ai_analysis.get('critical_survivors', [])
             if critical:
-                report += "### Critical Issues\n"
+                parts.append("### Critical Issues\n")
                 for item in critical[:3]:  # Top 3
-                    report += f"- {item.get('description', 'Critical mutation survived')}\n"
-                report += "\n"
+                    if isinstance(item, dict):
+                        parts.append(f"- {item.get('description', 'Critical mutation survived')}\n")
+                    else:
+                        parts.append(f"- {item}\n")
+                parts.append("\n")
             
             # Test recommendations
             recommendations = ai_analysis.get('test_recommendations', [])
             if recommendations:
-                report += "### Recommended Test Cases\n"
+                parts.append("### Recommended Test Cases\n")
                 for i, rec in enumerate(recommendations[:5], 1):  # Top 5
                     if isinstance(rec, dict):
-                        report += f"{i}. {rec.get('description', 'Add test case')}\n"
+                        parts.append(f"{i}. {rec.get('description', 'Add test case')}\n")
                     else:
-                        report += f"{i}. {rec}\n"
-                report += "\n"
+                        parts.append(f"{i}. {rec}\n")
+                parts.append("\n")
             
             # Overall assessment
             assessment = ai_analysis.get('overall_assessment', '')
             if assessment:
-                report += "### Assessment Summary\n"
-                report += f"{assessment}\n\n"
+                parts.append("### Assessment Summary\n")
+                parts.append(f"{assessment}\n\n")
         
         # Add actionable next steps
-        report += "## 🎯 Next Steps\n"
+        parts.append("## 🎯 Next Steps\n")
         if mutations_survived > 0:
-            report += "1. **Review survived mutations above** - these represent potential test gaps\n"
-            report += "2. **Add test cases** to catch the most critical mutations\n"
-            report += "3. **Focus on edge cases** - boundary conditions, error handling, special values\n"
-            report += "4. **Re-run mutation testing** after adding tests to verify improvements\n"
+            parts.append("1. **Review survived mutations above** - these represent potential test gaps\n")
+            parts.append("2. **Add test cases** to catch the most critical mutations\n")
+            parts.append("3. **Focus on edge cases** - boundary conditions, error handling, special values\n")
+            parts.append("4. **Re-run mutation testing** after adding tests to verify improvements\n")
         else:
-            report += "1. **Excellent work!** All tested mutations were caught\n"
-            report += "2. **Consider testing more mutations** by increasing the mutation limit\n"
-            report += "3. **Maintain quality** by running mutation testing regularly\n"
+            parts.append("1. **Excellent work!** All tested mutations were caught\n")
+            parts.append("2. **Consider testing more mutations** by increasing the mutation limit\n")
+            parts.append("3. **Maintain quality** by running mutation testing regularly\n")
         
         if mutations_tested < results.get('total_possible_mutations', 0):
             remaining = results.get('total_possible_mutations', 0) - mutations_tested
-            report += f"\n💡 **Note:** {remaining} additional mutations were generated but not tested. "
-            report += "Consider increasing the mutation limit for more comprehensive testing.\n"
+            parts.append(f"\n💡 **Note:** {remaining} additional mutations were generated but not tested. ")
+            parts.append("Consider increasing the mutation limit for more comprehensive testing.\n")
         
-        return report
+        return "".join(parts)
     
     def find_test_files(self) -> List[str]:
         """Find test files related to the target file."""